@@ -1,300 +1,599 @@
-import base64
-import os
-from datetime import datetime
-
-import cv2
-import numpy as np
-from flask import Flask, jsonify, request
-from ultralytics import YOLO
-
-from lego_pose import estimate_pose, draw_pose_visualization
-
-# -------------------------------------------------
-#  Setup
-# -------------------------------------------------
-app = Flask(__name__)
-
-MODEL_PATH = "best001.pt"
-model = YOLO(MODEL_PATH)
-CLASS_NAMES = model.names  # dict: id -> name
-
-SAVE_FOLDER = "detections"
-os.makedirs(SAVE_FOLDER, exist_ok=True)
-
-
-def crop_play_area(img, top_cut_ratio=0.18, bottom_cut_ratio=0.15):
-    """
-    Crop the top UI area (step label + thumbnails) so YOLO does not detect them.
-
-    Returns
-    -------
-    cropped : np.ndarray
-        Cropped BGR image.
-    y_start : int
-        Vertical offset of the cropped region in the original image.
-    """
-    h, w = img.shape[:2]
-    y_start = int(h * top_cut_ratio)
-    y_end = int(h * (1.0 - bottom_cut_ratio))
-    cropped = img[y_start:y_end, 0:w]
-    return cropped, y_start
-
-
-def draw_box_and_label(img, box, label, color=(0, 255, 0)):
-    x1, y1, x2, y2 = map(int, box)
-    cv2.rectangle(img, (x1, y1), (x2, y2), color, 2)
-    cv2.putText(
-        img,
-        label,
-        (x1, max(0, y1 - 10)),
-        cv2.FONT_HERSHEY_SIMPLEX,
-        0.8,
-        color,
-        2,
-        cv2.LINE_AA,
-    )
-
-
-def encode_image_to_base64(img_bgr):
-    _, buf = cv2.imencode(".jpg", img_bgr)
-    return base64.b64encode(buf.tobytes()).decode("utf-8")
-
-
-# -------------------------------------------------
-#  /check_piece : detect only the piece of the current step
-# -------------------------------------------------
-@app.route("/check_piece", methods=["POST"])
-def check_piece():
-    """
-    Receives:
-        {
-          "image": "<base64>",
-          "expected_class": "piece_name_from_unity",
-          "step_index": 0
-        }
-
-    Returns JSON:
-        {
-          "success": true/false,
-          "found": true/false,         # True only if the EXPECTED class was found
-          "matched": true/false,       # expected_class found AND confidence >= THRESH
-          "yolo_class": "xxx",         # equals expected_class when found, "" otherwise
-          "expected_class": "xxx",
-          "step_index": 0,
-          "confidence": 0.87,          # confidence of the expected piece
-          "annotated_image": "<base64>",
-          "yaw": float or null,
-          "pitch": float or null,
-          "roll": float or null,
-          "reproj_error": float or null,
-          "center_x": float,           # center in FULL image pixels, or -1.0 if unknown
-          "center_y": float,           # center in FULL image pixels, or -1.0 if unknown
-          "error": "..."               # only if success = false
-        }
-    """
-    try:
-        data = request.get_json()
-        if not data or "image" not in data or "expected_class" not in data:
-            return jsonify(
-                {
-                    "success": False,
-                    "error": "Missing 'image' or 'expected_class' in request",
-                }
-            )
-
-        expected_class = str(data["expected_class"]).strip()
-        step_index = int(data.get("step_index", -1))
-
-        # ------------- Decode image -------------
-        img_b64 = data["image"]
-        img_bytes = base64.b64decode(img_b64)
-        np_arr = np.frombuffer(img_bytes, np.uint8)
-        frame = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
-
-        if frame is None:
-            return jsonify(
-                {"success": False, "error": "Failed to decode image from Base64"}
-            )
-
-        # Crop the top UI area (so YOLO sees only the play area)
-        frame_cropped, crop_y_start = crop_play_area(frame)
-
-        # ------------- Run YOLO -------------
-        results = model(frame_cropped)
-        r = results[0]
-        boxes = r.boxes
-        kpts = getattr(r, "keypoints", None)
-
-        # Default center in full image coordinates (unknown)
-        center_x_full = -1.0
-        center_y_full = -1.0
-
-        # If there are no detections at all
-        if boxes is None or len(boxes) == 0:
-            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_name = os.path.join(SAVE_FOLDER, f"no_det_{ts}.jpg")
-            cv2.imwrite(save_name, frame_cropped)
-
-            return jsonify(
-                {
-                    "success": True,
-                    "found": False,
-                    "matched": False,
-                    "yolo_class": "",
-                    "expected_class": expected_class,
-                    "step_index": step_index,
-                    "confidence": 0.0,
-                    "annotated_image": encode_image_to_base64(frame_cropped),
-                    "yaw": None,
-                    "pitch": None,
-                    "roll": None,
-                    "reproj_error": None,
-                    "center_x": center_x_full,
-                    "center_y": center_y_full,
-                }
-            )
-
-        # -------------------- Filter by expected_class --------------------
-        confs = boxes.conf.cpu().numpy()
-        cls_ids = boxes.cls.cpu().numpy().astype(int)
-
-        candidate_indices = []
-        for i, cls_id in enumerate(cls_ids):
-            cls_name = CLASS_NAMES.get(cls_id, f"class_{cls_id}")
-            if cls_name == expected_class:
-                candidate_indices.append(i)
-
-        annotated = frame_cropped.copy()
-
-        # Case 1: expected piece is NOT found at all in this frame
-        if len(candidate_indices) == 0:
-            # For debugging, draw all detections with their names
-            for i, cls_id in enumerate(cls_ids):
-                box = boxes.xyxy[i].cpu().numpy()
-                cls_name = CLASS_NAMES.get(cls_id, f"class_{cls_id}")
-                conf = float(confs[i])
-                label = f"{cls_name} {conf:.2f}"
-                draw_box_and_label(annotated, box, label)
-
-            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_name = os.path.join(
-                SAVE_FOLDER, f"no_expected_step{step_index}_{ts}.jpg"
-            )
-            cv2.imwrite(save_name, annotated)
-
-            return jsonify(
-                {
-                    "success": True,
-                    "found": False,          # expected_class is NOT in the frame
-                    "matched": False,
-                    "yolo_class": "",
-                    "expected_class": expected_class,
-                    "step_index": step_index,
-                    "confidence": 0.0,
-                    "annotated_image": encode_image_to_base64(annotated),
-                    "yaw": None,
-                    "pitch": None,
-                    "roll": None,
-                    "reproj_error": None,
-                    "center_x": center_x_full,
-                    "center_y": center_y_full,
-                }
-            )
-
-        # Case 2: at least one detection for expected_class exists
-        # Pick the candidate with the highest confidence
-        best_i = max(candidate_indices, key=lambda idx: confs[idx])
-        best_box = boxes.xyxy[best_i].cpu().numpy()
-        best_conf = float(confs[best_i])
-        best_cls_id = cls_ids[best_i]
-        yolo_class = CLASS_NAMES.get(best_cls_id, f"class_{best_cls_id}")
-
-        yaw = pitch = roll = None
-        reproj_error = None
-
-        # Extract keypoints for this detection (if available)
-        image_points = None
-        if kpts is not None and len(kpts) > best_i:
-            try:
-                image_points = (
-                    kpts[best_i].xy[0].cpu().numpy().astype(np.float32)
-                )
-            except Exception:
-                image_points = None
-
-        pose_result = None
-        if image_points is not None:
-            pose_result = estimate_pose(
-                image=annotated,
-                keypoints_2d=image_points,
-                part_id=yolo_class,
-                camera_matrix=None,
-                dist_coeffs=None,
-            )
-
-        # Draw visualization and compute full-image center
-        if pose_result is not None and pose_result.get("success"):
-            yaw = pose_result.get("yaw")
-            pitch = pose_result.get("pitch")
-            roll = pose_result.get("roll")
-            reproj_error = pose_result.get("reproj_error")
-
-            cx_local = pose_result.get("center_x")
-            cy_local = pose_result.get("center_y")
-
-            if isinstance(cx_local, (int, float)) and isinstance(
-                cy_local, (int, float)
-            ):
-                center_x_full = float(cx_local)
-                center_y_full = float(cy_local + crop_y_start)
-
-            draw_pose_visualization(
-                annotated,
-                best_box,
-                image_points,
-                pose_result,
-                yolo_class,
-                best_conf,
-            )
-        else:
-            label_text = f"{yolo_class} {best_conf:.2f}"
-            draw_box_and_label(annotated, best_box, label_text)
-
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        save_name = os.path.join(
-            SAVE_FOLDER, f"expected_step{step_index}_{yolo_class}_{ts}.jpg"
-        )
-        cv2.imwrite(save_name, annotated)
-
-        THRESH = 0.45
-        matched = best_conf >= THRESH  # class is already guaranteed to match
-
-        return jsonify(
-            {
-                "success": True,
-                "found": True,              # expected_class was found
-                "matched": matched,
-                "yolo_class": yolo_class,   # should be equal to expected_class
-                "expected_class": expected_class,
-                "step_index": step_index,
-                "confidence": best_conf,
-                "annotated_image": encode_image_to_base64(annotated),
-                "yaw": float(yaw) if yaw is not None else None,
-                "pitch": float(pitch) if pitch is not None else None,
-                "roll": float(roll) if roll is not None else None,
-                "reproj_error": (
-                    float(reproj_error) if reproj_error is not None else None
-                ),
-                "center_x": float(center_x_full),
-                "center_y": float(center_y_full),
-            }
-        )
-
-    except Exception as e:
-        print("ERROR in /check_piece:", repr(e))
-        return jsonify({"success": False, "error": str(e)})
-
-
-if __name__ == "__main__":
-    print("YOLO model loaded successfully!")
-    app.run(host="0.0.0.0", port=5000, debug=True)
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+
+import cv2
+import numpy as np
+import torch
+from flask import Flask, request
+from ultralytics import YOLO
+
+try:
+    # SIMD (AVX2) base64, ~20x faster than the stdlib on big JPEG buffers
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    # Rust serializer, ~5-10x faster than the stdlib on the base64-heavy
+    # response payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+from lego_pose import estimate_pose, draw_pose_visualization
+
+# -------------------------------------------------
+#  Setup
+# -------------------------------------------------
+app = Flask(__name__)
+
+# Prefer the TensorRT engines exported by export_engine.py (INT8 first,
+# then FP16); fall back to the PyTorch weights if none has been built yet.
+MODEL_PATH = next(
+    (p for p in ("best001_int8.engine", "best001.engine") if os.path.exists(p)),
+    "best001.pt",
+)
+model = YOLO(MODEL_PATH)
+CLASS_NAMES = model.names  # dict: id -> name
+NAME_TO_ID = {v: k for k, v in CLASS_NAMES.items()}  # reverse map for filtering
+
+# Warm up once so the first request does not pay the TRT builder/cuDNN lag
+# (on a CUDA-less host the worker's CPU fallback path is used instead)
+if torch.cuda.is_available():
+    model(np.zeros((640, 640, 3), np.uint8), imgsz=640, device=0, half=True, verbose=False)
+else:
+    model(np.zeros((640, 640, 3), np.uint8), imgsz=640, device="cpu", verbose=False)
+
+SAVE_FOLDER = "detections"
+os.makedirs(SAVE_FOLDER, exist_ok=True)
+
+# Quality 80 roughly halves encode time and payload size versus OpenCV's
+# default 95; the annotated image is only used for debug display in Unity.
+JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 80, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+
+# Decode incoming JPEGs at reduced resolution: YOLO resizes to 640 anyway,
+# and libjpeg's reduced decode skips most of the IDCT work (about half the
+# decode time at scale 2 for 1080p frames). Centers returned to the client
+# are scaled back to full-image pixels. Set DECODE_SCALE=1 to disable.
+DECODE_SCALE = int(os.getenv("DECODE_SCALE", "2"))
+_IMREAD_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+if DECODE_SCALE not in _IMREAD_FLAGS:
+    raise ValueError(
+        f"DECODE_SCALE must be one of {sorted(_IMREAD_FLAGS)}, "
+        f"got {DECODE_SCALE}"
+    )
+# Resolved once here so a bad value fails at startup, not per request
+_IMREAD_FLAG = _IMREAD_FLAGS[DECODE_SCALE]
+
+# Debug saves are off by default; set SAVE_DETECTIONS=1 to write frames
+# to SAVE_FOLDER. Writes happen on a small pool so the request thread
+# never blocks on disk I/O or the extra JPEG encode.
+SAVE_DETECTIONS = os.getenv("SAVE_DETECTIONS", "0") == "1"
+_save_pool = ThreadPoolExecutor(max_workers=2)
+
+# Filenames use a startup timestamp plus a counter: strftime syscalls per
+# request show up in profiles under load, and the counter keeps names
+# unique across restarts just as well.
+_RUN_TS = datetime.now().strftime("%Y%m%d_%H%M%S")
+_save_seq = itertools.count()
+
+
+def save_detection(prefix, img):
+    """Queue a debug JPEG write; no-op unless SAVE_DETECTIONS=1."""
+    if not SAVE_DETECTIONS:
+        return
+    save_name = os.path.join(
+        SAVE_FOLDER, f"{prefix}_{_RUN_TS}_{next(_save_seq)}.jpg"
+    )
+    # Copy so the request thread can keep drawing on / reusing the frame
+    _save_pool.submit(cv2.imwrite, save_name, img.copy(), JPEG_PARAMS)
+
+# -------------------------------------------------
+#  Micro-batching: aggregate concurrent requests into one YOLO call
+# -------------------------------------------------
+MAX_BATCH = 4        # frames per model call (engine is built with batch=8)
+MAX_WAIT_MS = 8      # how long to wait for more frames before running
+PREDICT_TIMEOUT_S = 10.0
+
+_infer_queue = queue.Queue()
+
+# With CUDA, frames are letterboxed into a preallocated pinned host
+# buffer and uploaded with one async copy on a dedicated stream; pinned
+# memory roughly doubles cudaMemcpy bandwidth versus pageable NumPy
+# arrays and the upload overlaps with kernel launch.
+_USE_PINNED = torch.cuda.is_available()
+if _USE_PINNED:
+    _host_buf = torch.empty(
+        (MAX_BATCH, 640, 640, 3), dtype=torch.uint8, pin_memory=True
+    )
+    _host_np = _host_buf.numpy()
+    _h2d_stream = torch.cuda.Stream()
+
+
+def _letterbox_into(frame, dst):
+    """
+    Resize `frame` into the 640x640 `dst` slot, keeping aspect ratio and
+    padding with gray (114), the same scheme Ultralytics uses.
+
+    Returns
+    -------
+    (gain, pad_x, pad_y) : tuple
+        Mapping back to frame coordinates: x_frame = (x - pad_x) / gain.
+    """
+    h, w = frame.shape[:2]
+    gain = min(640.0 / h, 640.0 / w)
+    new_w, new_h = int(round(w * gain)), int(round(h * gain))
+    pad_x = (640 - new_w) // 2
+    pad_y = (640 - new_h) // 2
+    dst[:] = 114
+    dst[pad_y : pad_y + new_h, pad_x : pad_x + new_w] = cv2.resize(
+        frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR
+    )
+    return gain, pad_x, pad_y
+
+
+def _run_batch(frames):
+    """Run one model call on a list of frames; returns (results, metas)."""
+    if not _USE_PINNED:
+        # CPU fallback: let Ultralytics do its own preprocessing
+        results = model(frames, imgsz=640, verbose=False)
+        return results, [(1.0, 0, 0)] * len(frames)
+
+    metas = [_letterbox_into(f, _host_np[i]) for i, f in enumerate(frames)]
+    with torch.cuda.stream(_h2d_stream):
+        dev = _host_buf[: len(frames)].to("cuda", non_blocking=True)
+    torch.cuda.current_stream().wait_stream(_h2d_stream)
+    # dev was allocated on _h2d_stream but is consumed on the current
+    # stream; tell the caching allocator so the memory is not recycled
+    # while the current stream still reads it
+    dev.record_stream(torch.cuda.current_stream())
+    # BHWC uint8 -> BCHW half in [0,1], BGR -> RGB, all on the GPU
+    x = dev.permute(0, 3, 1, 2).flip(1).contiguous().half().div_(255.0)
+    # Tensor input skips Ultralytics preprocessing, so boxes/keypoints come
+    # back in 640x640 letterbox coordinates; metas map them to crop coords.
+    results = model(x, imgsz=640, verbose=False)
+    # Make sure the async copy out of the pinned buffer has finished before
+    # the worker letterboxes the next batch into it; do not rely on
+    # Ultralytics' postprocess having synced the stream for us
+    _h2d_stream.synchronize()
+    return results, metas
+
+
+def _inference_worker():
+    """Drain the queue, run one batched model call, dispatch results."""
+    while True:
+        frame, fut = _infer_queue.get()
+        batch = [(frame, fut)]
+        # Collect a few more frames against ONE deadline, so the first
+        # frame never waits longer than MAX_WAIT_MS total no matter how
+        # the stragglers trickle in
+        deadline = time.monotonic() + MAX_WAIT_MS / 1000.0
+        while len(batch) < MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_infer_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        frames = [f for f, _ in batch]
+        try:
+            results, metas = _run_batch(frames)
+        except Exception as e:
+            for _, f in batch:
+                f.set_exception(e)
+            continue
+
+        for (_, f), r, meta in zip(batch, results, metas):
+            f.set_result((r, meta))
+
+
+def predict(frame):
+    """
+    Enqueue a frame and block until its YOLO result is ready.
+
+    Returns
+    -------
+    (result, (gain, pad_x, pad_y)) : tuple
+        The Ultralytics result and the letterbox mapping back to frame
+        coordinates (identity on the CPU fallback path).
+    """
+    fut = Future()
+    _infer_queue.put((frame, fut))
+    return fut.result(timeout=PREDICT_TIMEOUT_S)
+
+
+threading.Thread(target=_inference_worker, daemon=True).start()
+
+
+# Frames from one client all share a shape, so the crop bounds are
+# computed once per frame height instead of per request.
+_crop_bounds_cache = {}
+
+
+def crop_play_area(img, top_cut_ratio=0.18, bottom_cut_ratio=0.15):
+    """
+    Crop the top UI area (step label + thumbnails) so YOLO does not detect them.
+
+    Returns
+    -------
+    cropped : np.ndarray
+        Cropped BGR image (C-contiguous, so YOLO's preprocess does not
+        make a hidden copy).
+    y_start : int
+        Vertical offset of the cropped region in the original image.
+    """
+    h, w = img.shape[:2]
+    key = (h, top_cut_ratio, bottom_cut_ratio)
+    bounds = _crop_bounds_cache.get(key)
+    if bounds is None:
+        bounds = (int(h * top_cut_ratio), int(h * (1.0 - bottom_cut_ratio)))
+        _crop_bounds_cache[key] = bounds
+    y_start, y_end = bounds
+
+    cropped = img[y_start:y_end, 0:w]
+    # Full-width row slices stay contiguous; this only copies if a caller
+    # ever passes a non-contiguous frame.
+    if not cropped.flags["C_CONTIGUOUS"]:
+        cropped = np.ascontiguousarray(cropped)
+    return cropped, y_start
+
+
+def draw_box_and_label(img, box, label, color=(0, 255, 0)):
+    x1, y1, x2, y2 = map(int, box)
+    cv2.rectangle(img, (x1, y1), (x2, y2), color, 2)
+    cv2.putText(
+        img,
+        label,
+        (x1, max(0, y1 - 10)),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        0.8,
+        color,
+        2,
+        cv2.LINE_AA,
+    )
+
+
+if hasattr(base64, "b64decode_as_bytearray"):
+    # pybase64 can decode straight into a freshly sized bytearray, skipping
+    # the immutable-bytes intermediate (one less full-payload allocation);
+    # np.frombuffer then views the buffer without copying either way.
+    def b64decode_raw(s):
+        return base64.b64decode_as_bytearray(s)
+else:
+    def b64decode_raw(s):
+        return base64.b64decode(s, validate=False)
+
+
+def encode_image_to_base64(img_bgr):
+    _, buf = cv2.imencode(".jpg", img_bgr, JPEG_PARAMS)
+    # b64encode takes the buffer directly, no tobytes() copy needed
+    return base64.b64encode(buf).decode("ascii")
+
+
+def dumps(payload):
+    """Serialize a response payload to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def json_response(payload):
+    return app.response_class(dumps(payload), mimetype="application/json")
+
+
+# Every /check_piece branch answers with the same 13-key schema; build it
+# once and copy per response instead of re-creating the dict literal (and
+# re-interning its keys) on the hot path.
+_RESPONSE_DEFAULTS = {
+    "success": True,
+    "found": False,
+    "matched": False,
+    "yolo_class": "",
+    "expected_class": "",
+    "step_index": -1,
+    "confidence": 0.0,
+    "yaw": None,
+    "pitch": None,
+    "roll": None,
+    "reproj_error": None,
+    "center_x": -1.0,
+    "center_y": -1.0,
+}
+
+
+def make_payload(**fields):
+    """Copy the default response schema and override the given fields."""
+    payload = _RESPONSE_DEFAULTS.copy()
+    payload.update(fields)
+    return payload
+
+
+def respond(payload, annotated_img=None):
+    """
+    Build the /check_piece response.
+
+    Default: JSON with the annotated image base64-embedded (what the
+    current Unity client expects). If the client sends
+    "Accept: image/jpeg", return the annotated JPEG as the raw body and
+    put the JSON fields in an "X-Result" header instead — this skips the
+    response-side base64 entirely (~33% less bandwidth, no encode loop).
+    """
+    if annotated_img is not None and "image/jpeg" in request.headers.get(
+        "Accept", ""
+    ):
+        _, buf = cv2.imencode(".jpg", annotated_img, JPEG_PARAMS)
+        resp = app.response_class(buf.tobytes(), mimetype="image/jpeg")
+        # Headers must be latin-1 safe and payload fields echo client
+        # strings; the stdlib encoder escapes non-ASCII (orjson does not)
+        resp.headers["X-Result"] = json.dumps(payload, ensure_ascii=True)
+        return resp
+
+    if annotated_img is not None:
+        payload["annotated_image"] = encode_image_to_base64(annotated_img)
+    return json_response(payload)
+
+
+# -------------------------------------------------
+#  /check_piece : detect only the piece of the current step
+# -------------------------------------------------
+@app.route("/check_piece", methods=["POST"])
+def check_piece():
+    """
+    Receives either multipart/form-data (preferred, no base64 overhead):
+        image           -> raw JPEG file
+        expected_class  -> "piece_name_from_unity"
+        step_index      -> 0
+
+    or the legacy JSON body:
+        {
+          "image": "<base64>",
+          "expected_class": "piece_name_from_unity",
+          "step_index": 0
+        }
+
+    Returns JSON (or, with "Accept: image/jpeg", the annotated JPEG as
+    the body and the JSON fields in an "X-Result" header):
+        {
+          "success": true/false,
+          "found": true/false,         # True only if the EXPECTED class was found
+          "matched": true/false,       # expected_class found AND confidence >= THRESH
+          "yolo_class": "xxx",         # equals expected_class when found, "" otherwise
+          "expected_class": "xxx",
+          "step_index": 0,
+          "confidence": 0.87,          # confidence of the expected piece
+          "annotated_image": "<base64>",
+          "yaw": float or null,
+          "pitch": float or null,
+          "roll": float or null,
+          "reproj_error": float or null,
+          "center_x": float,           # center in FULL image pixels, or -1.0 if unknown
+          "center_y": float,           # center in FULL image pixels, or -1.0 if unknown
+          "error": "..."               # only if success = false
+        }
+    """
+    try:
+        # ------------- Read request (multipart preferred) -------------
+        if "image" in request.files:
+            # Raw JPEG upload: no base64 decode, ~33% smaller payload
+            img_bytes = request.files["image"].read()
+            expected_class = str(request.form.get("expected_class", "")).strip()
+            step_index = int(request.form.get("step_index", -1))
+            if not expected_class:
+                return json_response(
+                    {
+                        "success": False,
+                        "error": "Missing 'expected_class' in request",
+                    }
+                )
+        else:
+            # Legacy JSON body with a base64-encoded image
+            data = request.get_json()
+            if not data or "image" not in data or "expected_class" not in data:
+                return json_response(
+                    {
+                        "success": False,
+                        "error": "Missing 'image' or 'expected_class' in request",
+                    }
+                )
+
+            expected_class = str(data["expected_class"]).strip()
+            step_index = int(data.get("step_index", -1))
+            img_bytes = b64decode_raw(data["image"])
+
+        # ------------- Decode image -------------
+        np_arr = np.frombuffer(img_bytes, np.uint8)
+        frame = cv2.imdecode(np_arr, _IMREAD_FLAG)
+
+        if frame is None:
+            return json_response(
+                {"success": False, "error": "Failed to decode image"}
+            )
+
+        # Crop the top UI area (so YOLO sees only the play area)
+        frame_cropped, crop_y_start = crop_play_area(frame)
+
+        # ------------- Run YOLO -------------
+        r, (gain, pad_x, pad_y) = predict(frame_cropped)
+        boxes = r.boxes
+        kpts = getattr(r, "keypoints", None)
+
+        # Default center in full image coordinates (unknown)
+        center_x_full = -1.0
+        center_y_full = -1.0
+
+        # If there are no detections at all
+        if boxes is None or len(boxes) == 0:
+            save_detection("no_det", frame_cropped)
+
+            return respond(
+                make_payload(
+                    expected_class=expected_class, step_index=step_index
+                ),
+                frame_cropped,
+            )
+
+        # -------------------- Filter by expected_class --------------------
+        # Compare class ids on the GPU: non-matching detections never cross
+        # the PCIe bus, and the no-match case costs a single-bool D2H copy.
+        exp_id = NAME_TO_ID.get(expected_class)
+        best_i = None
+        if exp_id is not None:
+            with torch.inference_mode():
+                mask = boxes.cls.to(torch.int32) == exp_id
+                if bool(mask.any()):
+                    sel = mask.nonzero(as_tuple=True)[0]
+                    best_i = int(sel[boxes.conf[sel].argmax()])
+
+        # Draw directly on the crop; nothing else reads it afterwards and
+        # save_detection() copies before handing frames to the writer pool.
+        annotated = frame_cropped
+
+        # Case 1: expected piece is NOT found at all in this frame
+        if best_i is None:
+            if SAVE_DETECTIONS:
+                # Debug only: fetch host arrays and draw every detection
+                # with its name; production traffic skips all of this.
+                boxes_xyxy = (
+                    boxes.xyxy.cpu().numpy() - (pad_x, pad_y, pad_x, pad_y)
+                ) / gain
+                confs = boxes.conf.cpu().numpy()
+                cls_ids = boxes.cls.cpu().numpy().astype(np.int32)
+                for i, cls_id in enumerate(cls_ids):
+                    box = boxes_xyxy[i]
+                    cls_name = CLASS_NAMES.get(cls_id, f"class_{cls_id}")
+                    conf = float(confs[i])
+                    label = f"{cls_name} {conf:.2f}"
+                    draw_box_and_label(annotated, box, label)
+
+                save_detection(f"no_expected_step{step_index}", annotated)
+
+            # found stays False: expected_class is NOT in the frame
+            return respond(
+                make_payload(
+                    expected_class=expected_class, step_index=step_index
+                ),
+                annotated,
+            )
+
+        # Case 2: the highest-confidence detection of expected_class was
+        # picked on the GPU. Fetch its box row (xyxy, conf, cls) and its
+        # keypoints in ONE device-to-host copy — every .cpu() call is a
+        # stream sync, so concatenate on the GPU first.
+        best_t = boxes.data[best_i].float()
+        kpt_flat = None
+        if kpts is not None and len(kpts) > best_i:
+            try:
+                kpt_t = kpts.xy[best_i].reshape(-1).float()
+                host = torch.cat((best_t, kpt_t)).cpu().numpy()
+                best_row = host[: best_t.shape[0]]
+                kpt_flat = host[best_t.shape[0] :]
+            except Exception:
+                best_row = best_t.cpu().numpy()
+        else:
+            best_row = best_t.cpu().numpy()
+
+        best_box = (best_row[:4] - (pad_x, pad_y, pad_x, pad_y)) / gain
+        best_conf = float(best_row[4])
+        best_cls_id = int(best_row[5])
+        yolo_class = CLASS_NAMES.get(best_cls_id, f"class_{best_cls_id}")
+
+        yaw = pitch = roll = None
+        reproj_error = None
+
+        image_points = None
+        if kpt_flat is not None and kpt_flat.size:
+            image_points = (
+                (kpt_flat.reshape(-1, 2) - (pad_x, pad_y)) / gain
+            ).astype(np.float32)
+
+        pose_result = None
+        if image_points is not None:
+            pose_result = estimate_pose(
+                image=annotated,
+                keypoints_2d=image_points,
+                part_id=yolo_class,
+                camera_matrix=None,
+                dist_coeffs=None,
+            )
+
+        # Draw visualization and compute full-image center
+        if pose_result is not None and pose_result.get("success"):
+            yaw = pose_result.get("yaw")
+            pitch = pose_result.get("pitch")
+            roll = pose_result.get("roll")
+            reproj_error = pose_result.get("reproj_error")
+
+            cx_local = pose_result.get("center_x")
+            cy_local = pose_result.get("center_y")
+
+            if isinstance(cx_local, (int, float)) and isinstance(
+                cy_local, (int, float)
+            ):
+                # Scale back to FULL-resolution image pixels (the frame was
+                # decoded at 1/DECODE_SCALE)
+                center_x_full = float(cx_local) * DECODE_SCALE
+                center_y_full = float(cy_local + crop_y_start) * DECODE_SCALE
+
+            draw_pose_visualization(
+                annotated,
+                best_box,
+                image_points,
+                pose_result,
+                yolo_class,
+                best_conf,
+            )
+        else:
+            label_text = f"{yolo_class} {best_conf:.2f}"
+            draw_box_and_label(annotated, best_box, label_text)
+
+        save_detection(f"expected_step{step_index}_{yolo_class}", annotated)
+
+        THRESH = 0.45
+        matched = best_conf >= THRESH  # class is already guaranteed to match
+
+        return respond(
+            make_payload(
+                found=True,                 # expected_class was found
+                matched=matched,
+                yolo_class=yolo_class,      # should be equal to expected_class
+                expected_class=expected_class,
+                step_index=step_index,
+                confidence=best_conf,
+                yaw=float(yaw) if yaw is not None else None,
+                pitch=float(pitch) if pitch is not None else None,
+                roll=float(roll) if roll is not None else None,
+                reproj_error=(
+                    float(reproj_error) if reproj_error is not None else None
+                ),
+                center_x=float(center_x_full),
+                center_y=float(center_y_full),
+            ),
+            annotated,
+        )
+
+    except Exception as e:
+        print("ERROR in /check_piece:", repr(e))
+        return json_response({"success": False, "error": str(e)})
+
+
+if __name__ == "__main__":
+    # Dev fallback only. In production serve with gunicorn (see README):
+    #   gunicorn --workers 1 --threads 8 --worker-class gthread \
+    #       --bind 0.0.0.0:5000 Server:app
+    # One worker keeps a single copy of the model in VRAM; threads overlap
+    # client I/O and JPEG work with GPU inference.
+    print("YOLO model loaded successfully!")
+    app.run(host="0.0.0.0", port=5000, threaded=True)
@@ -0,0 +1,53 @@
+"""
+One-shot export of the trained pose model to a TensorRT engine.
+
+Run this once on the inference machine (the engine is built for the local
+GPU and is not portable):
+
+    python export_engine.py            # FP16 engine -> best001.engine
+    python export_engine.py --int8     # INT8 engine -> best001_int8.engine
+
+The INT8 export calibrates on frames saved by the server under
+detections/ (see calib.yaml). Keep the FP16 engine around and compare
+mAP on a held-out set before switching production to INT8; if accuracy
+regresses, stay on FP16. Server.py picks up best001_int8.engine first,
+then best001.engine, then the .pt weights.
+"""
+import argparse
+import os
+
+from ultralytics import YOLO
+
+
+def export(int8=False):
+    model = YOLO("best001.pt")
+    model.export(
+        format="engine",
+        half=not int8,   # FP16 on Tensor Cores (ignored for INT8)
+        int8=int8,
+        data="calib.yaml" if int8 else None,
+        simplify=True,
+        dynamic=True,
+        batch=8,         # headroom for the server's micro-batching queue
+        imgsz=640,
+        device=0,
+        workspace=4,     # GB of builder workspace
+    )
+    if int8:
+        # The exporter always writes best001.engine; keep the FP16 engine
+        # as the accuracy-validation fallback by renaming the INT8 one.
+        os.replace("best001.engine", "best001_int8.engine")
+        print("Exported best001_int8.engine")
+    else:
+        print("Exported best001.engine")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--int8",
+        action="store_true",
+        help="calibrate on detections/ and build an INT8 engine",
+    )
+    args = parser.parse_args()
+    export(int8=args.int8)